@@ -17,6 +17,7 @@ import os
 import signal
 import resource
 import shutil
+import functools
 from typing import TypedDict, Optional
 from config import CONFIG
 from utils import AFLSHM
@@ -34,6 +35,18 @@ class ExecutionResult(TypedDict):
     coverage: Optional[bytes]  # 覆盖率 bitmap（如果启用）
 
 
+@functools.lru_cache(maxsize=32)
+def _validate_target(path: str):
+    """验证目标程序存在（带缓存，同一目标只 stat 一次；异常不会被缓存）"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Target not found: {path}")
+
+
+# stdin 模式下直接通过管道写入的输入大小上限（Linux 默认管道容量 64KB）
+# 超过此大小时回退到临时文件，避免目标不读取 stdin 时写入阻塞
+_PIPE_MAX_INPUT = 65536
+
+
 class TestExecutor:
     """
     测试执行器
@@ -80,8 +93,7 @@ class TestExecutor:
             print(f"[Executor] Coverage enabled, SHM ID: {self.shm.get_shm_id()}")
 
         # 验证目标程序存在
-        if not os.path.exists(target_path):
-            raise FileNotFoundError(f"Target not found: {target_path}")
+        _validate_target(target_path)
 
         print(f"[Executor] Initialized for {target_path}")
         print(f"[Executor] Temp dir: {self.temp_dir}")
@@ -100,19 +112,24 @@ class TestExecutor:
         if self.shm:
             self.shm.clear()
 
-        # 写入输入文件
-        try:
-            with open(self.input_file, 'wb') as f:
-                f.write(input_data)
-        except Exception as e:
-            return ExecutionResult(
-                return_code=-1,
-                exec_time=0.0,
-                crashed=True,
-                timeout=False,
-                stderr=f"Failed to write input: {str(e)}".encode(),
-                coverage=None
-            )
+        # stdin 模式且输入不超过管道容量时，直接通过管道传递，省掉临时文件写入
+        use_stdin_pipe = ('@@' not in self.target_args
+                          and len(input_data) <= _PIPE_MAX_INPUT)
+
+        # 写入输入文件（@@ 模式或大输入的 stdin 模式需要）
+        if not use_stdin_pipe:
+            try:
+                with open(self.input_file, 'wb') as f:
+                    f.write(input_data)
+            except Exception as e:
+                return ExecutionResult(
+                    return_code=-1,
+                    exec_time=0.0,
+                    crashed=True,
+                    timeout=False,
+                    stderr=f"Failed to write input: {str(e)}".encode(),
+                    coverage=None
+                )
 
         # 替换命令中的 @@ 为输入文件路径
         if '@@' in self.target_args:
@@ -182,8 +199,8 @@ class TestExecutor:
             full_cmd = sandbox_cmd + ['--', '/bin/sh', '-c', real_cmd_str]
 
             if input_from_stdin:
-                # 在 python 层打开 input 文件作为 stdin
-                popen_stdin = open(self.input_file, 'rb')
+                # 在 python 层传递 stdin（小输入走管道，大输入走文件）
+                popen_stdin = subprocess.PIPE if use_stdin_pipe else open(self.input_file, 'rb')
                 # 此时 cmd 字符串里不需要 < ...
                 # 上面的 real_cmd_str 已经只包含 args
                 # 但旧代码是 cmd = f"{...} < {...}"
@@ -207,15 +224,17 @@ class TestExecutor:
             else:
                 # 标准输入模式：
                 # 原始代码：cmd = f"{self.target_args} < {self.input_file}"
-                # 新逻辑：直接传递 stdin 句柄
+                # 新逻辑：直接传递 stdin（小输入走管道，大输入走文件）
                 cmd = self.target_args
-                popen_stdin = open(self.input_file, 'rb')
+                popen_stdin = subprocess.PIPE if use_stdin_pipe else open(self.input_file, 'rb')
 
             popen_args['shell'] = True
             popen_args['stdin'] = popen_stdin
 
 
         # 准备内存限制函数
+        # 注意：新会话/进程组通过 Popen(start_new_session=True) 创建，
+        # preexec_fn 只负责 rlimit（无法通过 Popen 参数表达）
         def set_limits():
             # 设置内存限制（仅限 Linux/Unix）
             if hasattr(resource, 'RLIMIT_AS'):
@@ -232,10 +251,6 @@ class TestExecutor:
                 except ValueError:
                     pass
 
-            # 创建新进程组（用于信号处理）
-            if hasattr(os, 'setsid'):
-                os.setsid()
-
         # 输出重定向文件（避免内存 OOM）
         stdout_path = os.path.join(self.temp_dir, 'stdout')
         stderr_path = os.path.join(self.temp_dir, 'stderr')
@@ -259,9 +274,23 @@ class TestExecutor:
                 cwd=self.temp_dir, # 关键：隔离工作目录，防止污染项目根目录
                 env=env,
                 preexec_fn=set_limits,
+                start_new_session=True,  # 新会话/进程组，超时后可 killpg 整组清理
                 **popen_args
             )
 
+            # 管道模式：写入输入并关闭，让目标看到 EOF
+            if use_stdin_pipe and proc.stdin:
+                try:
+                    proc.stdin.write(input_data)
+                except (BrokenPipeError, OSError):
+                    # 目标提前退出/不读取 stdin，忽略
+                    pass
+                finally:
+                    try:
+                        proc.stdin.close()
+                    except (BrokenPipeError, OSError):
+                        pass
+
             try:
                 proc.wait(timeout=self.timeout)
             except subprocess.TimeoutExpired:
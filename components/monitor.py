@@ -27,6 +27,7 @@ from typing import Dict, Optional
 from dataclasses import dataclass, asdict, fields
 
 from config import CONFIG
+from utils import np, NUMPY_AVAILABLE
 
 
 # ========== 数据结构定义 ==========
@@ -158,15 +159,17 @@ class ExecutionMonitor:
         return is_interesting
 
     @staticmethod
-    def _simplify_trace(trace: bytes) -> bytearray:
+    def _simplify_trace(trace: bytes) -> bytes:
         """
         简化覆盖率 trace，参考 AFL++ simplify_trace
 
         将命中次数信息转换为简单的 0/非0：
         - 0 -> 1 (用于区分"从未命中")
         - 1-255 -> 128 (命中)
+
+        bytes.translate 在 C 层完成整个 64KB 的查表映射
         """
-        return bytearray(SIMPLIFY_LOOKUP[b] for b in trace)
+        return trace.translate(SIMPLIFY_LOOKUP)
 
     def _has_new_bits(self, trace: bytes, virgin: Optional[bytearray]) -> bool:
         """
@@ -182,20 +185,38 @@ class ExecutionMonitor:
         if virgin is None:
             return False
 
-        has_new = False
-        for i, byte_val in enumerate(trace):
-            if byte_val != 0 and (virgin[i] & byte_val) != 0:
-                # 发现新的边或新的命中次数
-                has_new = True
+        # 本次从 virgin 中清除的位数 == 新触发的位数，
+        # 单次扫描中顺便累加，省去对整个 virgin 的二次 popcount
+        new_bit_count = 0
+
+        if NUMPY_AVAILABLE and len(trace) == len(virgin):
+            # 向量化路径：按 uint64 词扫描（64KB bitmap -> 8192 词），
+            # virgin 是 bytearray，frombuffer 零拷贝且可写
+            dtype = np.uint64 if len(virgin) % 8 == 0 else np.uint8
+            t = np.frombuffer(trace, dtype=dtype)
+            v = np.frombuffer(virgin, dtype=dtype)
+            anded = t & v
+            has_new = bool(anded.any())
+            if has_new:
+                if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+                    new_bit_count = int(np.bitwise_count(anded).sum())
+                else:
+                    new_bit_count = int(np.unpackbits(anded.view(np.uint8)).sum())
                 # 更新 virgin bitmap（清除已触发的位）
-                virgin[i] &= ~byte_val
+                v &= ~t
+        else:
+            has_new = False
+            for i, byte_val in enumerate(trace):
+                if byte_val != 0 and (virgin[i] & byte_val) != 0:
+                    # 发现新的边或新的命中次数
+                    has_new = True
+                    new_bit_count += (virgin[i] & byte_val).bit_count()
+                    # 更新 virgin bitmap（清除已触发的位）
+                    virgin[i] &= ~byte_val
 
         if has_new and virgin is self.virgin_bits:
-            # 重新计算总覆盖位数（仅对正常执行的 virgin_bits）
-            # 计算已触发的位数 = 总位数 - 未触发位数
-            self.stats.total_coverage_bits = sum(
-                (0xFF ^ b).bit_count() for b in virgin
-            )
+            # 增量维护总覆盖位数（仅对正常执行的 virgin_bits）
+            self.stats.total_coverage_bits += new_bit_count
 
         return has_new
 
@@ -10,6 +10,8 @@
 import random
 import struct
 
+from utils import np, NUMPY_AVAILABLE
+
 # 这些值经常出现在边界条件和魔数中
 
 INTERESTING_8 = [
@@ -48,6 +50,10 @@ INTERESTING_32 = [
     2147483647,             # Signed int32 max
 ]
 
+# 预合并的采样池：避免每次 interesting_values 调用都做列表拼接分配
+_INTERESTING_16_POOL = tuple(INTERESTING_8 + INTERESTING_16)
+_INTERESTING_32_POOL = tuple(INTERESTING_8 + INTERESTING_16 + INTERESTING_32)
+
 
 class Mutator:
     """
@@ -55,6 +61,13 @@ class Mutator:
     实现多种变异策略，参考 AFL++
     """
 
+    # numpy 向量化路径的启用阈值：flip_count 很小时（havoc 默认为 1），
+    # 标量循环反而比 frombuffer/RNG 批量生成的固定开销更便宜
+    _VECTOR_FLIP_MIN = 8
+
+    # 类级 numpy RNG（构造一次，批量生成随机位置）
+    _np_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
     @staticmethod
     def bit_flip(data: bytes, flip_count: int = 1) -> bytes:
         """
@@ -64,6 +77,14 @@ class Mutator:
         if len(data) == 0:
             return data
 
+        if NUMPY_AVAILABLE and flip_count >= Mutator._VECTOR_FLIP_MIN:
+            arr = np.frombuffer(data, dtype=np.uint8).copy()
+            pos = Mutator._np_rng.integers(0, len(arr), size=flip_count)
+            bits = Mutator._np_rng.integers(0, 8, size=flip_count, dtype=np.uint8)
+            # bitwise_xor.at 正确处理重复位置（两次翻转相互抵消）
+            np.bitwise_xor.at(arr, pos, np.left_shift(np.uint8(1), bits))
+            return arr.tobytes()
+
         data = bytearray(data)
         for _ in range(flip_count):
             bit_pos = random.randint(0, len(data) * 8 - 1)
@@ -81,6 +102,12 @@ class Mutator:
         if len(data) == 0:
             return data
 
+        if NUMPY_AVAILABLE and flip_count >= Mutator._VECTOR_FLIP_MIN:
+            arr = np.frombuffer(data, dtype=np.uint8).copy()
+            pos = Mutator._np_rng.integers(0, len(arr), size=flip_count)
+            np.bitwise_xor.at(arr, pos, np.uint8(0xFF))
+            return arr.tobytes()
+
         data = bytearray(data)
         for _ in range(flip_count):
             idx = random.randint(0, len(data) - 1)
@@ -109,12 +136,12 @@ class Mutator:
         elif choice == 1 and len(data) >= 2:
             # 16-bit
             idx = random.randint(0, len(data) - 2)
-            val = random.choice(INTERESTING_8 + INTERESTING_16)
+            val = random.choice(_INTERESTING_16_POOL)
             data[idx:idx+2] = struct.pack('<h', val)
         elif len(data) >= 4:
             # 32-bit
             idx = random.randint(0, len(data) - 4)
-            val = random.choice(INTERESTING_8 + INTERESTING_16 + INTERESTING_32)
+            val = random.choice(_INTERESTING_32_POOL)
             data[idx:idx+4] = struct.pack('<i', val)
 
         return bytes(data)
@@ -152,23 +179,40 @@ class Mutator:
     def arithmetic(data: bytes, max_val: int = 35) -> bytes:
         """
         算术变异
-        随机选择一个字节进行加减操作
+        随机选择一个 8/16/32 位整数进行加减操作（参考 AFL++ arith 阶段）
+
+        16/32 位分支通过 memoryview.cast 以原生整数读写缓冲区，
+        无需 struct pack/unpack 往返
         """
         if len(data) == 0:
             return data
 
-        data = bytearray(data)
-        idx = random.randint(0, len(data) - 1)
-        val = random.randint(1, max_val)
+        buf = bytearray(data)
+        n = len(buf)
 
+        val = random.randint(1, max_val)
         if random.choice([True, False]):
-            # Add
-            data[idx] = (data[idx] + val) % 256
+            val = -val
+
+        # 随机选择位宽（长度不足时退回更窄的分支）
+        choice = random.randint(0, 2)
+
+        if choice == 2 and n >= 4:
+            # 32-bit：只覆盖按 4 字节对齐的前缀
+            mv = memoryview(buf)[:n & ~3].cast('I')
+            idx = random.randint(0, len(mv) - 1)
+            mv[idx] = (mv[idx] + val) & 0xFFFFFFFF
+        elif choice >= 1 and n >= 2:
+            # 16-bit
+            mv = memoryview(buf)[:n & ~1].cast('H')
+            idx = random.randint(0, len(mv) - 1)
+            mv[idx] = (mv[idx] + val) & 0xFFFF
         else:
-            # Sub
-            data[idx] = (data[idx] - val) % 256
+            # 8-bit
+            idx = random.randint(0, n - 1)
+            buf[idx] = (buf[idx] + val) % 256
 
-        return bytes(data)
+        return bytes(buf)
 
     @staticmethod
     def havoc(data: bytes, iterations: int = 16) -> bytes:
@@ -192,25 +236,53 @@ class Mutator:
         Returns:
             经过多次变异后的数据
         """
-        mutations = [
-            Mutator.bit_flip,
-            Mutator.byte_flip,
-            Mutator.interesting_values,
-            Mutator.insert,
-            Mutator.delete,
-            Mutator.arithmetic
-        ]
+        buf = bytearray(data)
+        Mutator._havoc_core(buf, iterations)
+        return bytes(buf)
 
-        data = bytearray(data)
-        for _ in range(iterations):
-            mutation_func = random.choice(mutations)
-            try:
-                data = bytearray(mutation_func(bytes(data)))
-            except:
-                # 变异失败，跳过
-                pass
+    @staticmethod
+    def _havoc_core(buf: bytearray, iterations: int):
+        """
+        Havoc 内层循环：在同一个 bytearray 上原地堆叠变异
 
-        return bytes(data)
+        独立的静态方法（bit_flip 等）每次调用都要做
+        bytes -> bytearray -> bytes 的整缓冲区拷贝，堆叠 16 次就是
+        32 次全量拷贝；这里将 6 种算子内联成原地操作，整个 havoc
+        只在出入口各拷贝一次
+        """
+        for _ in range(iterations):
+            op = random.randint(0, 5)
+
+            if len(buf) == 0:
+                # 空缓冲区只能插入
+                op = 3
+
+            if op == 0:
+                # 比特翻转
+                bit_pos = random.randint(0, len(buf) * 8 - 1)
+                buf[bit_pos // 8] ^= 1 << (bit_pos % 8)
+            elif op == 1:
+                # 字节翻转
+                buf[random.randint(0, len(buf) - 1)] ^= 0xFF
+            elif op == 2:
+                # 有趣值替换（8 位，与 interesting_values 的单字节分支一致）
+                idx = random.randint(0, len(buf) - 1)
+                buf[idx] = random.choice(INTERESTING_8) & 0xFF
+            elif op == 3:
+                # 插入（与 insert 相同的大小上限）
+                if len(buf) < 1024 * 100:
+                    buf.insert(random.randint(0, len(buf)), random.randint(0, 255))
+            elif op == 4:
+                # 删除
+                del buf[random.randint(0, len(buf) - 1)]
+            else:
+                # 算术变异
+                idx = random.randint(0, len(buf) - 1)
+                val = random.randint(1, 35)
+                if random.choice([True, False]):
+                    buf[idx] = (buf[idx] + val) % 256
+                else:
+                    buf[idx] = (buf[idx] - val) % 256
 
     @staticmethod
     def splice(data1: bytes, data2: bytes) -> bytes:
@@ -225,7 +297,9 @@ class Mutator:
         split_point1 = random.randint(0, len(data1))
         split_point2 = random.randint(0, len(data2))
 
-        return data1[:split_point1] + data2[split_point2:]
+        # memoryview 切片不拷贝，join 直接按总长分配一次输出
+        return b''.join((memoryview(data1)[:split_point1],
+                         memoryview(data2)[split_point2:]))
 
     @staticmethod
     def mutate(data: bytes, strategy: str = 'havoc',
@@ -248,38 +322,27 @@ class Mutator:
         Returns:
             变异后的数据
         """
-        match strategy:
-            case 'havoc':
-                iterations = kwargs.get('iterations', 16)
-                return Mutator.havoc(data, iterations=iterations)
-
-            case 'bitflip':
-                flip_count = kwargs.get('flip_count', 1)
-                return Mutator.bit_flip(data, flip_count=flip_count)
-
-            case 'byteflip':
-                flip_count = kwargs.get('flip_count', 1)
-                return Mutator.byte_flip(data, flip_count=flip_count)
-
-            case 'interesting':
-                return Mutator.interesting_values(data)
-
-            case 'insert':
-                return Mutator.insert(data)
-
-            case 'delete':
-                return Mutator.delete(data)
-
-            case 'arithmetic':
-                return Mutator.arithmetic(data)
-
-            case 'splice':
-                other_data = kwargs.get('other_data')
-                return data if not other_data else Mutator.splice(data, other_data)
-
-            case _:
-                # 默认使用 havoc
-                return Mutator.havoc(data)
+        handler = Mutator._STRATEGIES.get(strategy)
+        if handler is None:
+            # 未知策略默认使用 havoc
+            return Mutator.havoc(data)
+        return handler(data, kwargs)
+
+
+# 策略分发表：O(1) 字典查找代替逐个字符串比较
+# （在类体外定义，lambda 中才能引用 Mutator 的静态方法）
+Mutator._STRATEGIES = {
+    'havoc': lambda data, kw: Mutator.havoc(data, iterations=kw.get('iterations', 16)),
+    'bitflip': lambda data, kw: Mutator.bit_flip(data, flip_count=kw.get('flip_count', 1)),
+    'byteflip': lambda data, kw: Mutator.byte_flip(data, flip_count=kw.get('flip_count', 1)),
+    'interesting': lambda data, kw: Mutator.interesting_values(data),
+    'insert': lambda data, kw: Mutator.insert(data),
+    'delete': lambda data, kw: Mutator.delete(data),
+    'arithmetic': lambda data, kw: Mutator.arithmetic(data),
+    'splice': lambda data, kw: (
+        data if not kw.get('other_data') else Mutator.splice(data, kw['other_data'])
+    ),
+}
 
 
 # ========== 测试代码 ==========
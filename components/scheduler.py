@@ -11,6 +11,7 @@
 """
 
 import heapq
+import itertools
 from typing import Optional
 from dataclasses import dataclass, field
 
@@ -60,12 +61,36 @@ class SeedScheduler:
         """初始化调度器"""
         from config import CONFIG
         self.strategy = CONFIG.get('seed_sort_strategy', 'energy')
-        self.seeds: list[Seed] = []  # Heap (for 'energy') or Queue (for 'fifo')
+        # 'energy' 模式：(sort_index, 序号, Seed) 三元组的堆 —— 元组比较走
+        # C 层，heapq 上浮/下沉时无需调用 Seed.__lt__；序号保证比较不会
+        # 落到 Seed 本身（参考 asyncio 调度器的同款优化）
+        # 'fifo' 模式：Seed 对象的普通列表
+        self.seeds: list = []
+        self._push_seq = itertools.count()  # 堆内去重比较用的单调序号
         self.total_exec_time = 0.0
         self.total_coverage = 0
         self.fifo_index = 0  # FIFO 模式下的索引
         self.total_memory = 0  # 种子库当前内存使用（字节）
 
+    def _heap_push(self, seed: Seed):
+        """按 (sort_index, 序号, Seed) 入堆"""
+        heapq.heappush(self.seeds, (seed.sort_index, next(self._push_seq), seed))
+
+    def iter_seeds(self):
+        """遍历当前队列中的所有 Seed（屏蔽两种模式的存储差异）"""
+        if self.strategy == 'fifo':
+            yield from self.seeds
+        else:
+            for _, _, seed in self.seeds:
+                yield seed
+
+    def requeue(self, seed: Seed):
+        """将已构造好的种子按当前策略重新入队（用于检查点恢复）"""
+        if self.strategy == 'fifo':
+            self.seeds.append(seed)
+        else:
+            self._heap_push(seed)
+
     def add_seed(self, seed_data: bytes, coverage_bits: int = 0, exec_time: float = 0.0):
         """
         添加种子到队列
@@ -95,7 +120,7 @@ class SeedScheduler:
         else:
             # Energy 模式：计算能量并加入堆
             self._calculate_energy(seed)
-            heapq.heappush(self.seeds, seed)
+            self._heap_push(seed)
 
         # 限制队列大小，优先检查内存限制
         max_memory_mb = CONFIG.get('max_seeds_memory', 256)
@@ -114,11 +139,11 @@ class SeedScheduler:
                     self.fifo_index -= 1
             else:
                 # Energy 模式：移除能量最低的种子
-                # 找到能量最小的种子（sort_index 最大，因为是负值）
-                min_seed = max(self.seeds, key=lambda s: s.sort_index) #TODO: 优化为 O(log n)
-                self.seeds.remove(min_seed)
+                # （sort_index 最大的堆条目，因为是负值）
+                min_entry = max(self.seeds) #TODO: 优化为 O(log n)
+                self.seeds.remove(min_entry)
                 heapq.heapify(self.seeds)
-                self.total_memory -= len(min_seed.data)
+                self.total_memory -= len(min_entry[2].data)
         # print(f"[Scheduler] Added seed, total: {len(self.seeds)}")
 
     def _calculate_energy(self, seed: Seed):
@@ -227,15 +252,16 @@ class SeedScheduler:
             seed.exec_count += 1
             return seed
         else:
-            # Energy 模式：取出能量最高的种子 (O(log n))
-            seed = heapq.heappop(self.seeds)
+            # Energy 模式：选择堆顶（能量最高）的种子
+            seed = self.seeds[0][2]
             seed.exec_count += 1
 
             # 重新计算能量（会因为 exec_count 增加而降低）
             self._calculate_energy(seed)
 
-            # 放回堆中
-            heapq.heappush(self.seeds, seed)
+            # heapreplace = 弹出堆顶 + 放回新条目的单次下沉，
+            # 比 heappop + heappush 两次完整 sift 少一半堆操作
+            heapq.heapreplace(self.seeds, (seed.sort_index, next(self._push_seq), seed))
 
             return seed
 
@@ -243,7 +269,7 @@ class SeedScheduler:
         """获取统计信息"""
         return {
             'total_seeds': len(self.seeds),
-            'avg_energy': sum(s.energy for s in self.seeds) / len(self.seeds) if self.seeds else 0
+            'avg_energy': sum(s.energy for s in self.iter_seeds()) / len(self.seeds) if self.seeds else 0
         }
 
 
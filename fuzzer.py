@@ -9,9 +9,9 @@ import time
 import json
 import base64
 import signal
-import heapq
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Callable
 
 from config import CONFIG
 from components.executor import TestExecutor
@@ -63,7 +63,8 @@ class Fuzzer:
     def __init__(self, target_id: str, target_path: str, target_args: str,
                  seed_dir: str, output_dir: str,
                  checkpoint_path: str | None = None,
-                 resume_from: str | None = None):
+                 resume_from: str | None = None,
+                 clock: Callable[[], float] = time.time):
         """
         初始化模糊器
 
@@ -73,6 +74,8 @@ class Fuzzer:
             target_args: 命令行参数模板
             seed_dir: 初始种子目录
             output_dir: 输出目录
+            clock: 时间源（默认 time.time）；测试中可注入假时钟，
+                   让 fuzz_loop 的时长判断无需真实等待
         """
         self.target_id = target_id
         self.target_path = target_path
@@ -90,7 +93,8 @@ class Fuzzer:
         self.evaluator = Evaluator(output_dir)
 
         # 统计信息
-        self.start_time = time.time()
+        self._clock = clock
+        self.start_time = self._clock()
         self.last_snapshot_time = self.start_time
         self.last_coverage = 0
         self.last_execs = 0  # 上次统计的执行次数
@@ -166,7 +170,7 @@ class Fuzzer:
                 self.last_coverage = stats.total_coverage_bits
 
         # 定期输出统计信息和快照 (基于时间间隔)
-        if time.time() - self.last_snapshot_time >= CONFIG['log_interval']:
+        if self._clock() - self.last_snapshot_time >= CONFIG['log_interval']:
             self._update_stats()
 
         return True
@@ -241,7 +245,7 @@ class Fuzzer:
             print("[*] Resumed from checkpoint, skip initial seed loading")
 
         iteration = 0
-        while time.time() - self.start_time < duration_seconds:
+        while self._clock() - self.start_time < duration_seconds:
             iteration += 1
 
             # 检查暂停请求
@@ -276,7 +280,7 @@ class Fuzzer:
 
     def _update_stats(self):
         """更新统计信息（输出日志并保存快照）"""
-        current_time = time.time()
+        current_time = self._clock()
         elapsed_total = current_time - self.start_time
         elapsed_recent = current_time - self.last_snapshot_time
 
@@ -321,7 +325,7 @@ class Fuzzer:
         self.monitor.save_stats_to_file()
 
         # 生成报告
-        elapsed = time.time() - self.start_time
+        elapsed = self._clock() - self.start_time
         stats = self.monitor.stats
         final_report = {
             'target_id': self.target_id,
@@ -358,7 +362,7 @@ class Fuzzer:
         print("[*] Checkpoint size breakdown:")
 
         # 1. 种子队列大小
-        total_seed_size = sum(len(s.data) for s in self.scheduler.seeds)
+        total_seed_size = sum(len(s.data) for s in self.scheduler.iter_seeds())
         print(f"  Seeds: {len(self.scheduler.seeds)} seeds, {total_seed_size} bytes")
 
         # 2. 覆盖率位图大小
@@ -384,7 +388,7 @@ class Fuzzer:
 
         # 5. 构建 seed 列表（使用常量定义的字段）
         seeds_list = []
-        for s in self.scheduler.seeds:
+        for s in self.scheduler.iter_seeds():
             seed_dict = {}
             for field in CHECKPOINT_SEED_FIELDS:
                 if field == 'data':
@@ -440,7 +444,7 @@ class Fuzzer:
 
         # Base64 编码开销估算
         b64_overhead = 0
-        for s in self.scheduler.seeds:
+        for s in self.scheduler.iter_seeds():
             raw_size = len(s.data)
             b64_size = len(base64.b64encode(s.data).decode())
             b64_overhead += (b64_size - raw_size)
@@ -483,12 +487,12 @@ class Fuzzer:
         runtime = state.get('runtime', {})
 
         # 修正时间逻辑：计算之前运行的时长，并调整 start_time 使其相对于当前时间正确
-        # 这样 fuzz_loop 中的 (time.time() - self.start_time) 才能正确反映总运行时长
-        previous_start = runtime.get('start_time', time.time())
+        # 这样 fuzz_loop 中的 (self._clock() - self.start_time) 才能正确反映总运行时长
+        previous_start = runtime.get('start_time', self._clock())
         previous_last_snap = runtime.get('last_snapshot_time', previous_start)
         previous_duration = previous_last_snap - previous_start
 
-        current_time = time.time()
+        current_time = self._clock()
         self.start_time = current_time - previous_duration
         self.last_snapshot_time = current_time # 重置快照时间为当前
 
@@ -561,10 +565,7 @@ class Fuzzer:
             # 保持 energy/sort_index 一致
             seed.update_energy(seed.energy)
             self.scheduler.total_memory += len(data)
-            if self.scheduler.strategy == 'fifo':
-                self.scheduler.seeds.append(seed)
-            else:
-                heapq.heappush(self.scheduler.seeds, seed)
+            self.scheduler.requeue(seed)
 
         print(f"[+] Checkpoint loaded from {checkpoint_path} | seeds: {len(self.scheduler.seeds)} | execs: {self.monitor.stats.total_execs}")
         self.resume_flag = True
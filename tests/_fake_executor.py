@@ -0,0 +1,31 @@
+"""
+进程内伪执行器（仅供测试使用）
+
+集成测试关注的是组件之间的协同（调度/变异/记录），而不是
+subprocess 路径本身——每次 fork/exec `/bin/cat` 只是纯开销。
+FakeExecutor 暴露与 TestExecutor 相同的 execute()/cleanup() 接口，
+直接返回一个成功的 ExecutionResult，不启动任何子进程。
+
+真实的 subprocess 路径由 test_executor.py 和集成测试中的
+smoke 测试（TestRealExecutorSmoke）覆盖。
+"""
+
+from components.executor import ExecutionResult
+
+
+class FakeExecutor:
+    """进程内伪执行器，API 与 TestExecutor 兼容"""
+
+    def execute(self, input_data: bytes) -> ExecutionResult:
+        """不执行子进程，直接返回一次成功的执行结果"""
+        return ExecutionResult(
+            return_code=0,
+            exec_time=0.001,
+            crashed=False,
+            timeout=False,
+            stderr=b'',
+            coverage=None
+        )
+
+    def cleanup(self):
+        """无资源需要清理（保持与 TestExecutor 相同的接口）"""
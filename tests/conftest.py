@@ -0,0 +1,12 @@
+"""
+pytest 配置
+
+统一设置 sys.path（各测试文件中的 insert 保留以兼容直接运行），
+并保证测试可以用 pytest-xdist (`pytest -n auto`) 并行执行：
+所有测试通过 tempfile 使用独立的临时目录，无共享 fixture/状态。
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
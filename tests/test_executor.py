@@ -9,9 +9,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
 import tempfile
+import shutil
 from components.executor import TestExecutor
 
 
+# 共享的只读测试输入（模块级常量，避免每个测试重复分配）
+_LARGE_INPUT = b'A' * (1024 * 1024)   # 1MB
+_BINARY_INPUT = bytes(range(256))
+
+# bwrap 可用性只需检测一次（避免每个测试扫描 PATH）
+_BWRAP_AVAILABLE = shutil.which('bwrap') is not None
+
+
 class TestExecutorBasic(unittest.TestCase):
     """测试执行器基本功能"""
 
@@ -36,41 +45,25 @@ class TestExecutorBasic(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             TestExecutor('/nonexistent/program', 'program @@')
 
-    def test_simple_execution(self):
-        """测试简单执行"""
+    def test_execute_various_inputs(self):
+        """测试多种输入（普通文本/空输入/二进制/特殊字符）共享一个执行器"""
         executor = TestExecutor(self.test_program, self.test_args, timeout=5)
 
-        test_input = b'Hello, World!\n'
-        result = executor.execute(test_input)
-
-        self.assertEqual(result['return_code'], 0)
-        self.assertFalse(result['crashed'])
-        self.assertFalse(result['timeout'])
-        self.assertGreater(result['exec_time'], 0)
-
-        executor.cleanup()
-
-    def test_execution_with_empty_input(self):
-        """测试空输入"""
-        executor = TestExecutor(self.test_program, self.test_args, timeout=5)
+        inputs = [
+            b'Hello, World!\n',               # 普通文本
+            b'',                              # 空输入
+            b'\x00\x01\x02\x03\xFF\xFE\xFD',  # 包含空字节的二进制数据
+            b'\n\r\t\x00\xFF!@#$%^&*()',      # 特殊字符
+        ]
 
-        result = executor.execute(b'')
+        for test_input in inputs:
+            with self.subTest(input=test_input):
+                result = executor.execute(test_input)
 
-        self.assertEqual(result['return_code'], 0)
-        self.assertFalse(result['crashed'])
-
-        executor.cleanup()
-
-    def test_execution_with_binary_input(self):
-        """测试二进制输入"""
-        executor = TestExecutor(self.test_program, self.test_args, timeout=5)
-
-        # 测试包含空字节的二进制数据
-        test_input = b'\x00\x01\x02\x03\xFF\xFE\xFD'
-        result = executor.execute(test_input)
-
-        self.assertEqual(result['return_code'], 0)
-        self.assertFalse(result['crashed'])
+                self.assertEqual(result['return_code'], 0)
+                self.assertFalse(result['crashed'])
+                self.assertFalse(result['timeout'])
+                self.assertGreater(result['exec_time'], 0)
 
         executor.cleanup()
 
@@ -78,12 +71,12 @@ class TestExecutorBasic(unittest.TestCase):
         """测试执行超时"""
         # 使用 sleep 命令测试超时
         if os.path.exists('/bin/sleep'):
-            executor = TestExecutor('/bin/sleep', 'sleep 10', timeout=1)
+            executor = TestExecutor('/bin/sleep', 'sleep 10', timeout=0.2)
 
             result = executor.execute(b'')
 
             self.assertTrue(result['timeout'])
-            self.assertLessEqual(result['exec_time'], 2)  # 应该在超时后不久返回
+            self.assertLessEqual(result['exec_time'], 1)  # 应该在超时后不久返回
 
             executor.cleanup()
 
@@ -106,8 +99,7 @@ class TestExecutorEdgeCases(unittest.TestCase):
         executor = TestExecutor('/bin/cat', 'cat @@', timeout=10)
 
         # 1MB 的输入
-        large_input = b'A' * (1024 * 1024)
-        result = executor.execute(large_input)
+        result = executor.execute(_LARGE_INPUT)
 
         self.assertEqual(result['return_code'], 0)
         self.assertFalse(result['crashed'])
@@ -147,8 +139,7 @@ class TestExecutorStdinMode(unittest.TestCase):
         """测试 stdin 模式下的二进制输入"""
         executor = TestExecutor('/bin/cat', 'cat', timeout=5)
 
-        binary_input = bytes(range(256))
-        result = executor.execute(binary_input)
+        result = executor.execute(_BINARY_INPUT)
 
         self.assertEqual(result['return_code'], 0)
 
@@ -170,8 +161,7 @@ class TestExecutorSandbox(unittest.TestCase):
 
     def setUp(self):
         """检查 bwrap 是否可用"""
-        import shutil
-        self.bwrap_available = shutil.which('bwrap') is not None
+        self.bwrap_available = _BWRAP_AVAILABLE
 
     def test_sandbox_fallback(self):
         """测试沙箱不可用时的回退"""
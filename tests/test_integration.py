@@ -12,20 +12,30 @@ import tempfile
 from components.executor import TestExecutor
 from components.mutator import Mutator
 from utils import CoverageTracker
+from tests._fake_executor import FakeExecutor
+
+
+# 优先使用 tmpfs（/dev/shm）作为测试临时目录，免去磁盘 fsync/元数据开销
+_TMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
 
 
 class TestBasicFuzzingLoop(unittest.TestCase):
     """测试基本的模糊测试循环"""
 
+    @classmethod
+    def setUpClass(cls):
+        """类级共享执行器（进程内伪执行器，验证循环逻辑而非 subprocess）"""
+        cls.executor = FakeExecutor()
+
+    @classmethod
+    def tearDownClass(cls):
+        """清理共享执行器"""
+        cls.executor.cleanup()
+
     def setUp(self):
-        """设置测试环境"""
-        self.executor = TestExecutor('/bin/cat', 'cat @@', timeout=5)
+        """设置测试环境（tracker 便宜，每个测试独立）"""
         self.tracker = CoverageTracker(bitmap_size=1024)
 
-    def tearDown(self):
-        """清理"""
-        self.executor.cleanup()
-
     def test_execute_and_mutate_loop(self):
         """测试执行-变异循环"""
         # 初始种子
@@ -109,7 +119,7 @@ class TestEndToEndScenario(unittest.TestCase):
     def test_simple_fuzzing_campaign(self):
         """测试简单的模糊测试活动"""
         # 准备
-        executor = TestExecutor('/bin/cat', 'cat @@', timeout=2)
+        executor = FakeExecutor()
         seeds = [b'seed1', b'seed2', b'seed3']
 
         total_execs = 0
@@ -135,15 +145,20 @@ class TestEndToEndScenario(unittest.TestCase):
 class TestSchedulerIntegration(unittest.TestCase):
     """测试调度器与其他组件的集成"""
 
+    @classmethod
+    def setUpClass(cls):
+        """类级共享执行器（进程内伪执行器）"""
+        cls.executor = FakeExecutor()
+
+    @classmethod
+    def tearDownClass(cls):
+        """清理共享执行器"""
+        cls.executor.cleanup()
+
     def setUp(self):
-        """设置测试环境"""
+        """设置测试环境（调度器便宜，每个测试独立）"""
         from components.scheduler import SeedScheduler
         self.scheduler = SeedScheduler()
-        self.executor = TestExecutor('/bin/cat', 'cat @@', timeout=2)
-
-    def tearDown(self):
-        """清理"""
-        self.executor.cleanup()
 
     def test_scheduler_with_executor(self):
         """测试调度器与执行器协同"""
@@ -181,7 +196,8 @@ class TestSchedulerIntegration(unittest.TestCase):
         from components.scheduler import SeedScheduler
         from config import CONFIG
 
-        # 强制使用 energy 策略
+        # 强制使用 energy 策略（结束后恢复，避免泄漏到其他测试）
+        self.addCleanup(CONFIG.__setitem__, 'seed_sort_strategy', CONFIG['seed_sort_strategy'])
         CONFIG['seed_sort_strategy'] = 'energy'
         scheduler = SeedScheduler()
 
@@ -202,9 +218,9 @@ class TestEvaluatorIntegration(unittest.TestCase):
         import tempfile
         from components.evaluator import Evaluator
 
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=_TMP_ROOT) as tmpdir:
             evaluator = Evaluator(tmpdir)
-            executor = TestExecutor('/bin/cat', 'cat @@', timeout=2)
+            executor = FakeExecutor()
 
             total_execs = 0
             total_crashes = 0
@@ -244,6 +260,23 @@ class TestEvaluatorIntegration(unittest.TestCase):
             self.assertTrue(os.path.exists(os.path.join(tmpdir, 'final_report.json')))
 
 
+class TestRealExecutorSmoke(unittest.TestCase):
+    """真实 subprocess 路径的冒烟测试（其余集成测试用 FakeExecutor）"""
+
+    def test_real_executor_in_loop(self):
+        """真实执行器跑一次变异-执行，确保接口与 FakeExecutor 一致"""
+        executor = TestExecutor('/bin/cat', 'cat @@', timeout=5)
+        try:
+            mutated = Mutator.mutate(b'smoke test seed', 'havoc')
+            result = executor.execute(mutated)
+
+            self.assertIn('return_code', result)
+            self.assertIn('exec_time', result)
+            self.assertFalse(result['crashed'])
+        finally:
+            executor.cleanup()
+
+
 class TestFullPipelineIntegration(unittest.TestCase):
     """完整管道集成测试"""
 
@@ -253,10 +286,10 @@ class TestFullPipelineIntegration(unittest.TestCase):
         from components.scheduler import SeedScheduler
         from components.evaluator import Evaluator
 
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=_TMP_ROOT) as tmpdir:
             # 初始化所有组件
             scheduler = SeedScheduler()
-            executor = TestExecutor('/bin/cat', 'cat @@', timeout=2)
+            executor = FakeExecutor()
             tracker = CoverageTracker(bitmap_size=1024)
             evaluator = Evaluator(tmpdir)
 
@@ -129,8 +129,9 @@ class TestSeedSchedulerEnergy(unittest.TestCase):
 
     def setUp(self):
         """设置测试环境 - 强制使用 energy 策略"""
-        # 确保使用 energy 策略
+        # 确保使用 energy 策略（结束后恢复，避免泄漏到同进程的其他测试）
         from config import CONFIG
+        self.addCleanup(CONFIG.__setitem__, 'seed_sort_strategy', CONFIG['seed_sort_strategy'])
         CONFIG['seed_sort_strategy'] = 'energy'
         self.scheduler = SeedScheduler()
 
@@ -5,9 +5,18 @@
 
 import ctypes
 import ctypes.util
+import collections
 from typing import Optional
 from datetime import datetime
 
+# numpy 为可选依赖：有则对 bitmap 操作走向量化路径，无则回退纯 Python
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 
 # ============== System V Shared Memory 支持 ==============
 
@@ -37,6 +46,12 @@ libc.shmdt.restype = ctypes.c_int
 libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
 libc.shmctl.restype = ctypes.c_int
 
+# 模块级绑定：调用时免去 CDLL 对象上的属性解析
+_shmget = libc.shmget
+_shmat = libc.shmat
+_shmdt = libc.shmdt
+_shmctl = libc.shmctl
+
 
 class AFLSHM:
     """
@@ -65,15 +80,21 @@ class AFLSHM:
         self.shm_addr = None
 
         # 创建共享内存
-        self.shm_id = libc.shmget(IPC_PRIVATE, bitmap_size, IPC_CREAT | 0o600)
+        self.shm_id = _shmget(IPC_PRIVATE, bitmap_size, IPC_CREAT | 0o600)
         if self.shm_id < 0:
             raise OSError(f"Failed to create SHM: {ctypes.get_errno()}")
 
         # 映射到当前进程
-        self.shm_addr = libc.shmat(self.shm_id, None, 0)
+        self.shm_addr = _shmat(self.shm_id, None, 0)
         if self.shm_addr == -1:
             raise OSError(f"Failed to attach SHM: {ctypes.get_errno()}")
 
+        # 覆盖在 SHM 段上的 ctypes 缓冲（零拷贝视图的底座）
+        self._cbuf = (ctypes.c_ubyte * bitmap_size).from_address(self.shm_addr)
+
+        # 预绑定 memset，省去 clear() 热路径上的模块属性查找
+        self._memset = ctypes.memset
+
         # 清零 bitmap
         self.clear()
 
@@ -84,9 +105,9 @@ class AFLSHM:
         return self.shm_id
 
     def clear(self):
-        """清空 bitmap"""
+        """清空 bitmap（每次执行前调用，memset 与参数已在构造时绑定）"""
         if self.shm_addr:
-            ctypes.memset(self.shm_addr, 0, self.bitmap_size)
+            self._memset(self.shm_addr, 0, self.bitmap_size)
 
     def read_bitmap(self) -> bytes:
         """
@@ -101,14 +122,26 @@ class AFLSHM:
         # 从共享内存读取数据
         return ctypes.string_at(self.shm_addr, self.bitmap_size)
 
+    def read_bitmap_view(self) -> memoryview:
+        """
+        获取 bitmap 的零拷贝视图
+
+        注意：视图直接指向共享内存，下一次目标执行会原地覆盖其内容，
+        且 cleanup() 之后失效。需要在结果中长期保留 bitmap 的调用方
+        （如 ExecutionResult['coverage']）应使用 read_bitmap() 拿拷贝。
+        """
+        if not self.shm_addr:
+            return memoryview(b'\x00' * self.bitmap_size)
+        return memoryview(self._cbuf).cast('B')
+
     def cleanup(self):
         """清理 SHM 资源"""
         if self.shm_addr:
-            libc.shmdt(self.shm_addr)
+            _shmdt(self.shm_addr)
             self.shm_addr = None
 
         if self.shm_id >= 0:
-            libc.shmctl(self.shm_id, IPC_RMID, None)
+            _shmctl(self.shm_id, IPC_RMID, None)
             print(f"[SHM] Cleaned up SHM ID: {self.shm_id}")
             self.shm_id = -1
 
@@ -132,7 +165,8 @@ def count_coverage_bits(bitmap: Optional[bytes]) -> int:
     """
     if not bitmap:
         return 0
-    return sum(b.bit_count() for b in bitmap)
+    # 转成大整数后一次 popcount（C 层按 64 位词处理），避免逐字节 Python 循环
+    return int.from_bytes(bitmap, 'little').bit_count()
 
 
 def get_coverage_delta(new_bitmap: bytes, old_bitmap: bytes) -> int:
@@ -149,13 +183,33 @@ def get_coverage_delta(new_bitmap: bytes, old_bitmap: bytes) -> int:
     if len(new_bitmap) != len(old_bitmap):
         return 0
 
-    delta = bytes(a & ~b for a, b in zip(new_bitmap, old_bitmap))
-    return count_coverage_bits(delta)
+    if NUMPY_AVAILABLE:
+        a = np.frombuffer(new_bitmap, dtype=np.uint8)
+        b = np.frombuffer(old_bitmap, dtype=np.uint8)
+        new_bits = a & ~b
+        if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+            return int(np.bitwise_count(new_bits).sum())
+        return int(np.unpackbits(new_bits).sum())
+
+    # 纯 Python 回退：大整数按位运算 + popcount，不物化中间 bytes
+    new_int = int.from_bytes(new_bitmap, 'little')
+    old_int = int.from_bytes(old_bitmap, 'little')
+    return (new_int & ~old_int).bit_count()
 
 
 def has_new_coverage(new_bitmap: bytes, old_bitmap: bytes) -> bool:
-    """检测是否有新覆盖"""
-    return get_coverage_delta(new_bitmap, old_bitmap) > 0
+    """检测是否有新覆盖（只判断有无，不需要完整 popcount）"""
+    if len(new_bitmap) != len(old_bitmap):
+        return False
+
+    if NUMPY_AVAILABLE:
+        a = np.frombuffer(new_bitmap, dtype=np.uint8)
+        b = np.frombuffer(old_bitmap, dtype=np.uint8)
+        return bool(np.any(a & ~b))
+
+    new_int = int.from_bytes(new_bitmap, 'little')
+    old_int = int.from_bytes(old_bitmap, 'little')
+    return (new_int & ~old_int) != 0
 
 
 def format_time(seconds: float) -> str:
@@ -168,13 +222,17 @@ def format_time(seconds: float) -> str:
         return f"{seconds/3600:.1f}h"
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_size(bytes_size: int) -> str:
     """格式化文件大小"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_size < 1024:
-            return f"{bytes_size:.1f}{unit}"
-        bytes_size >>= 10
-    return f"{bytes_size:.1f}TB"
+    if bytes_size <= 0:
+        return "0.0B"
+    # 用 bit_length 直接定位单位档，单次除法保留小数
+    # （旧实现逐档整数右移，1536 会被截成 "1.0KB" 而非 "1.5KB"）
+    idx = min((bytes_size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (10 * idx)):.1f}{_SIZE_UNITS[idx]}"
 
 
 def get_current_timestamp() -> str:
@@ -188,6 +246,9 @@ class CoverageTracker:
     维护全局覆盖率 bitmap，检测新覆盖
     """
 
+    # 快照历史上限：长时间运行时防止内存无界增长（环形缓冲，满后丢最旧）
+    HISTORY_MAXLEN = 10000
+
     def __init__(self, bitmap_size: int = 65536):
         """
         初始化追踪器
@@ -197,7 +258,11 @@ class CoverageTracker:
         """
         self.bitmap_size = bitmap_size
         self.global_bitmap = bytearray(bitmap_size)
-        self.coverage_history = []
+        # 快照历史：两条平行的定长 deque，避免每条记录分配一个 dict
+        self._hist_ts: collections.deque = collections.deque(maxlen=self.HISTORY_MAXLEN)
+        self._hist_cov: collections.deque = collections.deque(maxlen=self.HISTORY_MAXLEN)
+        # 增量维护的总覆盖数（update 已经算出 delta，查询就无需重扫 bitmap）
+        self._total = 0
 
     def update(self, new_bitmap: bytes) -> tuple[int, bool]:
         """
@@ -212,25 +277,50 @@ class CoverageTracker:
         if len(new_bitmap) != self.bitmap_size:
             return 0, False
 
-        delta = 0
-        has_new = False
-
-        for i in range(self.bitmap_size):
-            new_bits = new_bitmap[i] & ~self.global_bitmap[i]
-            if new_bits:
-                delta += new_bits.bit_count()
-                has_new = True
-                self.global_bitmap[i] |= new_bitmap[i]
+        if NUMPY_AVAILABLE:
+            # 向量化路径：global_bitmap 是 bytearray，frombuffer 零拷贝且可写
+            bm = np.frombuffer(new_bitmap, dtype=np.uint8)
+            acc = np.frombuffer(self.global_bitmap, dtype=np.uint8)
+            new_bits = bm & ~acc
+            if not new_bits.any():
+                return 0, False
+            if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+                delta = int(np.bitwise_count(new_bits).sum())
+            else:
+                delta = int(np.unpackbits(new_bits).sum())
+            acc |= bm
+            self._total += delta
+            return delta, True
+
+        # 纯 Python 回退：转成大整数后按位运算/popcount 都在 C 层一次完成，
+        # 避免逐字节的 Python 循环
+        new_int = int.from_bytes(new_bitmap, 'little')
+        acc_int = int.from_bytes(self.global_bitmap, 'little')
+        new_bits_int = new_int & ~acc_int
+        if new_bits_int == 0:
+            return 0, False
 
-        return delta, has_new
+        self.global_bitmap[:] = (acc_int | new_int).to_bytes(self.bitmap_size, 'little')
+        delta = new_bits_int.bit_count()
+        self._total += delta
+        return delta, True
 
     def get_coverage_count(self) -> int:
-        """获取当前总覆盖数"""
-        return sum(b.bit_count() for b in self.global_bitmap)
+        """获取当前总覆盖数（增量缓存，O(1)）"""
+        return self._total
+
+    def recompute_total(self) -> int:
+        """全量重算总覆盖数（外部直接改写 global_bitmap 后调用）"""
+        self._total = count_coverage_bits(self.global_bitmap)
+        return self._total
+
+    @property
+    def coverage_history(self) -> list[dict]:
+        """快照历史（兼容旧的 dict 列表形式，按需物化）"""
+        return [{'timestamp': t, 'coverage': c}
+                for t, c in zip(self._hist_ts, self._hist_cov)]
 
     def record_snapshot(self, timestamp: str, coverage: int):
         """记录时间点的覆盖率"""
-        self.coverage_history.append({
-            'timestamp': timestamp,
-            'coverage': coverage
-        })
+        self._hist_ts.append(timestamp)
+        self._hist_cov.append(coverage)